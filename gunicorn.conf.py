@@ -0,0 +1,30 @@
+"""
+Gunicorn configuration for the Claude-Tasker web server.
+
+Run with:
+    gunicorn -c gunicorn.conf.py 'web-server:app'
+
+The gevent WebSocket worker lets blocking task-manager calls in the API
+handlers yield cooperatively, so one worker handles many concurrent
+dashboard clients plus their Socket.IO connections.
+"""
+
+import json
+from pathlib import Path
+
+_config_file = Path.home() / '.claude-tasker' / 'config.json'
+_port = 8080
+if _config_file.exists():
+    try:
+        _port = json.loads(_config_file.read_text()).get('web_port', 8080)
+    except (ValueError, OSError):
+        pass
+
+bind = f"0.0.0.0:{_port}"
+worker_class = 'geventwebsocket.gunicorn.workers.GeventWebSocketWorker'
+
+# Flask-SocketIO requires a single worker unless a message queue (Redis)
+# is configured to relay events between processes; concurrency comes from
+# the 1000 greenlets per worker instead
+workers = 1
+worker_connections = 1000
@@ -106,10 +106,37 @@ install_dependencies() {
     
     # Install Python packages
     pip3 install --user -r requirements.txt
-    
+
     print_color $GREEN "✓ Dependencies installed"
 }
 
+vendor_socketio_client() {
+    print_color $BLUE "📥 Vendoring Socket.IO browser client..."
+
+    # The web server serves this same-origin as a hashed static asset;
+    # flask-socketio only speaks the protocol and does not ship the JS
+    SOCKETIO_VERSION="4.7.5"
+    mkdir -p static
+
+    if [ -f "static/socket.io.min.js" ]; then
+        print_color $GREEN "✓ Socket.IO client already vendored"
+        return
+    fi
+
+    if command -v curl >/dev/null 2>&1; then
+        curl -sSL "https://cdn.socket.io/$SOCKETIO_VERSION/socket.io.min.js" -o static/socket.io.min.js
+    elif command -v wget >/dev/null 2>&1; then
+        wget -q "https://cdn.socket.io/$SOCKETIO_VERSION/socket.io.min.js" -O static/socket.io.min.js
+    fi
+
+    if [ -s "static/socket.io.min.js" ]; then
+        print_color $GREEN "✓ Socket.IO client vendored"
+    else
+        rm -f static/socket.io.min.js
+        print_color $YELLOW "⚠ Could not download Socket.IO client - dashboard will use the CDN"
+    fi
+}
+
 setup_claude_sdk() {
     print_color $BLUE "🔑 Setting up Claude SDK..."
     
@@ -229,8 +256,13 @@ create_shortcuts() {
 
 echo "🎯 Starting Claude-Tasker..."
 
-# Start web server in background
-python3 web-server.py &
+# Start web server in background - gunicorn with the gevent worker in
+# production (see gunicorn.conf.py), dev server as fallback
+if command -v gunicorn >/dev/null 2>&1; then
+    gunicorn -c gunicorn.conf.py 'web-server:app' &
+else
+    python3 web-server.py &
+fi
 WEB_PID=$!
 
 echo "🌐 Web interface: http://localhost:8080"
@@ -289,6 +321,7 @@ main() {
     check_prerequisites
     install_claude_tasker
     install_dependencies
+    vendor_socketio_client
     setup_claude_sdk
     setup_configuration
     setup_claude_integration
@@ -23,9 +23,24 @@ python3 -c "import anthropic, flask, flask_cors, flask_socketio" 2>/dev/null ||
     pip3 install --user anthropic flask flask-cors flask-socketio python-dotenv
 }
 
-# Start web server in background
+# Vendor the Socket.IO browser client if it's missing so the dashboard
+# can load it same-origin instead of falling back to the CDN
+if [ ! -s "static/socket.io.min.js" ]; then
+    echo "📥 Downloading Socket.IO client..."
+    mkdir -p static
+    curl -sSL "https://cdn.socket.io/4.7.5/socket.io.min.js" -o static/socket.io.min.js \
+        || rm -f static/socket.io.min.js
+fi
+
+# Start web server in background - gunicorn with the gevent worker in
+# production (see gunicorn.conf.py), dev server as fallback
 echo "🌐 Starting web interface..."
-python3 web-server.py &
+if command -v gunicorn >/dev/null 2>&1; then
+    gunicorn -c gunicorn.conf.py 'web-server:app' &
+else
+    echo "⚠️  gunicorn not found - falling back to the dev server"
+    python3 web-server.py &
+fi
 WEB_PID=$!
 
 echo "🌐 Web interface: http://localhost:8080"
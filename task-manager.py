@@ -4,16 +4,64 @@
 Manages task queue and triggers autonomous Claude execution
 """
 
+import atexit
+import heapq
 import json
+import re
+import secrets
 import time
 import os
 import argparse
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
+import sqlite3
 import subprocess
 import threading
 import asyncio
 import sys
+from functools import lru_cache, partial
+
+# Fast JSON for the queue hot paths (2-5x stdlib json); optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps_line(obj):
+    """Serialize one JSONL line, newline included"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode() + '\n'
+    return json.dumps(obj) + '\n'
+
+def _loads(data):
+    """Parse one JSON document (str or bytes)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Optional Aho-Corasick automaton for keyword classification; the compiled
+# regex fallback is still one linear scan instead of an 'in' check per keyword
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Keyword -> base execution time (seconds) for task complexity estimates
+COMPLEXITY_KEYWORDS = {
+    'update': 20, 'install': 30, 'build': 45, 'test': 25,
+    'deploy': 60, 'fix': 15, 'create': 30, 'refactor': 45
+}
+
+if ahocorasick is not None:
+    _KEYWORD_AC = ahocorasick.Automaton()
+    for _kw, _secs in COMPLEXITY_KEYWORDS.items():
+        _KEYWORD_AC.add_word(_kw, (_kw, _secs))
+    _KEYWORD_AC.make_automaton()
+    _KEYWORD_RE = None
+else:
+    _KEYWORD_AC = None
+    _KEYWORD_RE = re.compile('|'.join(map(re.escape, COMPLEXITY_KEYWORDS)))
 
 # Import Claude SDK executor
 try:
@@ -31,53 +79,138 @@ class ClaudeTaskManager:
         self.config_dir.mkdir(exist_ok=True)
         
         self.queue_file = self.config_dir / 'task-queue.jsonl'
+        self.queue_log_file = self.config_dir / 'task-queue.log.jsonl'
         self.completed_file = self.config_dir / 'completed-tasks.jsonl'
         self.execution_log = self.config_dir / 'execution.log'
         self.config_file = self.config_dir / 'config.json'
-        
+        self.db_file = self.config_dir / 'queue.db'
+
+        # One long-lived buffered writer for the log - an open/append/close
+        # cycle per line costs two extra syscalls each time
+        self._log_fp = open(self.execution_log, 'a', buffering=64 * 1024)
+        atexit.register(self.close)
+        
+        # In-memory queue cache, validated against the file mtimes so
+        # unchanged polls skip the disk read and re-parse entirely.
+        # The lock coalesces concurrent cold-cache misses into one read.
+        self._cache_lock = threading.Lock()
+        self._tasks_cache = None
+        self._queue_mtime_ns = -1
+        self._log_mtime_ns = -1
+        self._log_entries = 0
+        # SQLite cache validity marker: PRAGMA data_version moves when
+        # another connection (CLI, runner, web server) writes the db
+        self._db_data_version = None
+
+        # Indexes over the cache: id lookup, a lazy-deletion priority heap
+        # of pending tasks, and live status counts
+        self._by_id = {}
+        self._pending_heap = []
+        self._status_counts = Counter()
+
+        # Wakeup signalling for the autonomous loops: a threading.Event
+        # for the legacy thread path, and an asyncio.Event created lazily
+        # once the async loop is running
+        self._wakeup = threading.Event()
+        self._new_task_event = None
+        self._loop = None
+
+        # Config cache state, validated the same way as the tasks cache
+        self.config = None
+        self._config_mtime_ns = -1
+        self._config_hash = None
+
         self.load_config()
-        
-        # Initialize Claude SDK executor if available
-        self.claude_executor = None
-        if CLAUDE_SDK_AVAILABLE:
-            try:
-                self.claude_executor = ClaudeSDKExecutor()
-                self._log("✅ Claude SDK initialized successfully")
-            except Exception as e:
-                self._log(f"❌ Failed to initialize Claude SDK: {e}")
-                self._log("💡 Make sure CLAUDE_API_KEY environment variable is set")
-        else:
-            self._log("⚠️  Claude SDK not available - autonomous execution disabled")
-        
+
+        # Opt-in SQLite backend: indexed B-tree queries instead of JSONL
+        # scans; existing JSONL queues are imported on first open. The
+        # lock serializes the shared cross-thread connection.
+        self._db = None
+        self._db_lock = threading.Lock()
+        if self.config.get('storage_backend') == 'sqlite':
+            self._db = self._open_db()
+
+        # EWMA of task inter-arrival time, used to self-tune the legacy
+        # poll interval: short sleeps during bursts, long ones when quiet
+        self._arrival_ewma = float(self.config['task_check_interval'])
+        self._last_arrival_ts = time.monotonic()
+
+        # Claude SDK executor is built lazily on first access - the add/
+        # list/status/delete subcommands never touch it and shouldn't pay
+        # for client construction
+        self._claude_executor = None
+        self._executor_initialized = False
+
+    @property
+    def claude_executor(self):
+        """Claude SDK executor, constructed on first use"""
+        if not self._executor_initialized:
+            self._executor_initialized = True
+            if CLAUDE_SDK_AVAILABLE:
+                try:
+                    self._claude_executor = ClaudeSDKExecutor()
+                    self._log("✅ Claude SDK initialized successfully")
+                except Exception as e:
+                    self._log(f"❌ Failed to initialize Claude SDK: {e}")
+                    self._log("💡 Make sure CLAUDE_API_KEY environment variable is set")
+            else:
+                self._log("⚠️  Claude SDK not available - autonomous execution disabled")
+        return self._claude_executor
+
     def load_config(self):
-        """Load configuration from file or create defaults"""
+        """Load configuration from file or create defaults.
+
+        Cached behind the file mtime like the tasks cache - repeat calls
+        in a long-running process only pay a stat() until the file changes.
+        """
+        mtime = os.stat(self.config_file).st_mtime_ns if self.config_file.exists() else -1
+        if getattr(self, 'config', None) is not None and mtime == self._config_mtime_ns:
+            return self.config
+
         default_config = {
             'task_check_interval': 30,
             'max_retry_attempts': 3,
+            'max_workers': 2,
             'enable_auto_execution': True,
-            'log_level': 'info',
-            'webhook_token': self._generate_token()
+            'storage_backend': 'jsonl',
+            'log_level': 'info'
         }
-        
-        if self.config_file.exists():
+
+        if mtime != -1:
             with open(self.config_file, 'r') as f:
                 self.config = {**default_config, **json.load(f)}
         else:
             self.config = default_config
+
+        self._config_mtime_ns = mtime
+        self._config_hash = hash(json.dumps(self.config, sort_keys=True))
+
+        # Only draw from the CSPRNG when no token exists yet - the old
+        # default dict generated (and discarded) one on every load
+        if 'webhook_token' not in self.config:
+            self.config['webhook_token'] = self._generate_token()
             self.save_config()
-    
+
+        return self.config
+
     def save_config(self):
-        """Save current configuration"""
+        """Save current configuration; no-op when nothing changed"""
+        new_hash = hash(json.dumps(self.config, sort_keys=True))
+        if new_hash == self._config_hash and self.config_file.exists():
+            return
+
         with open(self.config_file, 'w') as f:
             json.dump(self.config, f, indent=2)
+        self._config_hash = new_hash
+        self._config_mtime_ns = os.stat(self.config_file).st_mtime_ns
     
-    def add_task(self, task, priority=3, tags=None, description=''):
-        """Add a task to the queue"""
+    def add_task(self, task, priority=3, tags=None, description='', task_id=None):
+        """Add a task to the queue; callers may supply a pre-generated id"""
         if tags is None:
             tags = []
-            
+
         task_obj = {
-            'id': f"task_{int(time.time() * 1000)}",
+            'id': task_id or f"task_{int(time.time() * 1000)}",
             'task': task,
             'priority': max(1, min(5, priority)),  # Clamp between 1-5
             'tags': tags,
@@ -88,106 +221,329 @@ class ClaudeTaskManager:
             'estimated_duration': None,
             'dependencies': []
         }
-        
-        with open(self.queue_file, 'a') as f:
-            f.write(json.dumps(task_obj) + '\n')
-        
+        # The estimate only depends on immutable fields - compute it once
+        # here instead of on every poll
+        task_obj['estimated_duration'] = self._estimate_execution_time(task_obj)
+
+
+        if self._db is not None:
+            self._db_upsert(task_obj)
+        else:
+            with open(self.queue_file, 'a') as f:
+                f.write(_dumps_line(task_obj))
+            self._queue_mtime_ns = os.stat(self.queue_file).st_mtime_ns
+
+        # Write-through: keep the cache and indexes consistent with the append
+        if self._tasks_cache is not None:
+            self._tasks_cache.append(task_obj)
+            self._by_id[task_obj['id']] = task_obj
+            self._status_counts['pending'] += 1
+            heapq.heappush(self._pending_heap,
+                           (-task_obj['priority'], task_obj['created_at'], task_obj['id']))
+
+        # Fold this arrival into the inter-arrival EWMA (alpha = 1/8)
+        now = time.monotonic()
+        self._arrival_ewma = 0.875 * self._arrival_ewma + 0.125 * (now - self._last_arrival_ts)
+        self._last_arrival_ts = now
+
         self._log(f"✅ Task added: {task} (Priority: {priority})")
+        self._signal_new_task()
         return task_obj['id']
-    
+
+    def _signal_new_task(self):
+        """Wake the autonomous loop immediately instead of waiting out the poll"""
+        self._wakeup.set()
+        if self._new_task_event is None:
+            return
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._new_task_event.set)
+        else:
+            self._new_task_event.set()
+
+    # Compact the delta log back into the snapshot after this many entries
+    COMPACT_THRESHOLD = 1000
+
+    def _load_tasks_cached(self):
+        """
+        Read the task queue through the in-memory cache. The snapshot plus
+        its delta log are only re-read when a file mtime changed since the
+        last load; the warm path (queue untouched between polls) costs two
+        stat calls. Returns a shallow copy so callers can't reorder the
+        cache itself.
+        """
+        if self._db is not None:
+            # SQLite: our own writes go through this connection and update
+            # the cache in-process, but the CLI, runner and web server are
+            # separate processes. PRAGMA data_version moves exactly when
+            # another connection changed the db, so one cheap query per
+            # read tells us whether the cache is still valid.
+            with self._db_lock:
+                version = self._db.execute('PRAGMA data_version').fetchone()[0]
+            if self._tasks_cache is None or version != self._db_data_version:
+                with self._cache_lock:
+                    if self._tasks_cache is None or version != self._db_data_version:
+                        with self._db_lock:
+                            rows = self._db.execute('SELECT data FROM tasks').fetchall()
+                        self._tasks_cache = [_loads(row[0]) for row in rows]
+                        self._db_data_version = version
+                        self._rebuild_index()
+            return list(self._tasks_cache)
+
+        queue_mtime = os.stat(self.queue_file).st_mtime_ns if self.queue_file.exists() else -1
+        log_mtime = os.stat(self.queue_log_file).st_mtime_ns if self.queue_log_file.exists() else -1
+
+        if queue_mtime == -1 and log_mtime == -1:
+            # Fresh install: still initialize the cache and indexes so the
+            # mutators have a (empty) cache to work against
+            if self._tasks_cache is None:
+                self._tasks_cache = []
+                self._rebuild_index()
+            return []
+
+        if (self._tasks_cache is None
+                or queue_mtime != self._queue_mtime_ns
+                or log_mtime != self._log_mtime_ns):
+            # Coalesce concurrent misses: everyone blocked here shares the
+            # reload the lock holder did, verified by re-checking staleness
+            with self._cache_lock:
+                if (self._tasks_cache is None
+                        or queue_mtime != self._queue_mtime_ns
+                        or log_mtime != self._log_mtime_ns):
+                    by_id, log_entries = self._replay_jsonl()
+                    self._tasks_cache = list(by_id.values())
+                    self._queue_mtime_ns = queue_mtime
+                    self._log_mtime_ns = log_mtime
+                    self._log_entries = log_entries
+                    self._rebuild_index()
+
+        return list(self._tasks_cache)
+
+    def _replay_jsonl(self):
+        """Replay the JSONL snapshot plus its delta log into an id map"""
+        by_id = {}
+        if self.queue_file.exists():
+            for raw in self._read_jsonl_lines(self.queue_file):
+                task = _loads(raw)
+                by_id[task['id']] = task
+
+        log_entries = 0
+        if self.queue_log_file.exists():
+            for raw in self._read_jsonl_lines(self.queue_log_file):
+                entry = _loads(raw)
+                log_entries += 1
+                if entry['op'] == 'delete':
+                    by_id.pop(entry['id'], None)
+                else:
+                    task = by_id.get(entry['id'])
+                    if task:
+                        task.update({k: v for k, v in entry.items()
+                                     if k not in ('op', 'id')})
+        return by_id, log_entries
+
+    @staticmethod
+    def _read_jsonl_lines(path):
+        """
+        Slurp a JSONL file as bytes on a raw fd and split once - skips
+        TextIOWrapper decoding and per-line read calls, and orjson/json
+        parse bytes directly.
+        """
+        fd = os.open(str(path), os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            chunks = []
+            while size > 0:
+                chunk = os.read(fd, min(size, 1024 * 1024))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size -= len(chunk)
+            data = b''.join(chunks)
+        finally:
+            os.close(fd)
+        return [line for line in data.splitlines() if line.strip()]
+
+    def _open_db(self):
+        """Open (and if needed create) the SQLite queue database.
+
+        The connection is shared across threads (status writes run in
+        executor threads, the web server uses a background writer), so
+        same-thread checking is off and _db_lock serializes access.
+        """
+        conn = sqlite3.connect(str(self.db_file), check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('''CREATE TABLE IF NOT EXISTS tasks (
+            id TEXT PRIMARY KEY,
+            status TEXT,
+            priority INTEGER,
+            created_at TEXT,
+            completed_at TEXT,
+            data TEXT
+        )''')
+        # Partial index: only the hot pending rows, in get_next_task order
+        conn.execute('''CREATE INDEX IF NOT EXISTS idx_pending
+                        ON tasks(priority DESC, created_at)
+                        WHERE status='pending' ''')
+        conn.commit()
+
+        # One-time import of an existing JSONL queue
+        if conn.execute('SELECT 1 FROM tasks LIMIT 1').fetchone() is None:
+            by_id, _ = self._replay_jsonl()
+            if by_id:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?)',
+                    [self._db_row(t) for t in by_id.values()])
+                conn.commit()
+                self._log(f"📦 Migrated {len(by_id)} tasks from JSONL to SQLite")
+
+        return conn
+
+    @staticmethod
+    def _db_row(task):
+        """Map a task dict onto the tasks table columns"""
+        return (task['id'], task['status'], task['priority'],
+                task['created_at'], task.get('completed_at'),
+                _dumps_line(task).rstrip('\n'))
+
+    def _db_upsert(self, task):
+        """Insert or replace one task row"""
+        with self._db_lock:
+            self._db.execute('INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?)',
+                             self._db_row(task))
+            self._db.commit()
+
+    def _rebuild_index(self):
+        """Rebuild the id map, pending heap and status counts from the cache"""
+        self._by_id = {t['id']: t for t in self._tasks_cache}
+        self._status_counts = Counter(t['status'] for t in self._tasks_cache)
+        self._pending_heap = [(-t['priority'], t['created_at'], t['id'])
+                              for t in self._tasks_cache if t['status'] == 'pending']
+        heapq.heapify(self._pending_heap)
+
+    def _append_delta(self, entry):
+        """
+        Append one mutation record to the delta log - O(1) bytes written
+        instead of rewriting the whole snapshot per update - and compact
+        once the log grows past the threshold.
+
+        The record goes out as a single os.write on an O_APPEND fd, so
+        concurrent writers can't interleave partial lines.
+        """
+        data = _dumps_line(entry).encode('utf-8')
+        fd = os.open(self.queue_log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+        self._log_mtime_ns = os.stat(self.queue_log_file).st_mtime_ns
+        self._log_entries += 1
+
+        if self._log_entries > self.COMPACT_THRESHOLD:
+            self._compact()
+
+    def _compact(self):
+        """Rewrite the snapshot from the in-memory cache and truncate the log"""
+        self._write_queue(self._tasks_cache)
+
+        with open(self.queue_log_file, 'w'):
+            pass
+        self._log_mtime_ns = os.stat(self.queue_log_file).st_mtime_ns
+        self._log_entries = 0
+
+    def _write_queue(self, tasks):
+        """Rewrite the queue file and refresh the cache in one step"""
+        with open(self.queue_file, 'w') as f:
+            for task in tasks:
+                f.write(_dumps_line(task))
+
+        self._tasks_cache = list(tasks)
+        self._queue_mtime_ns = os.stat(self.queue_file).st_mtime_ns
+
     def get_next_task(self):
-        """Get highest priority pending task"""
-        if not self.queue_file.exists():
-            return None
-            
-        tasks = []
-        with open(self.queue_file, 'r') as f:
-            for line in f:
-                if line.strip():
-                    task = json.loads(line)
-                    if task['status'] == 'pending':
-                        tasks.append(task)
-        
-        if not tasks:
-            return None
-            
-        # Sort by priority (higher first) then by creation time
-        tasks.sort(key=lambda x: (-x['priority'], x['created_at']))
-        return tasks[0]
-    
-    def get_all_tasks(self, status=None, limit=None):
+        """Get highest priority pending task - O(log N) via the pending heap"""
+        self._load_tasks_cached()
+
+        # Lazy deletion: entries whose task is gone or no longer pending
+        # are popped on the way past instead of being removed eagerly
+        while self._pending_heap:
+            _, _, task_id = self._pending_heap[0]
+            task = self._by_id.get(task_id)
+            if task is not None and task['status'] == 'pending':
+                return task
+            heapq.heappop(self._pending_heap)
+
+        return None
+
+    def get_all_tasks(self, status=None, limit=None, sort=True):
         """Get all tasks, optionally filtered by status"""
-        tasks = []
-        
-        if self.queue_file.exists():
-            with open(self.queue_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        task = json.loads(line)
-                        if status is None or task['status'] == status:
-                            tasks.append(task)
-        
-        # Sort by creation time (newest first)
-        tasks.sort(key=lambda x: x['created_at'], reverse=True)
-        
+        tasks = [t for t in self._load_tasks_cached()
+                 if status is None or t['status'] == status]
+
+        # Sort by creation time (newest first); callers that only count or
+        # don't care about order can skip the O(N log N) pass
+        if sort:
+            tasks.sort(key=lambda x: x['created_at'], reverse=True)
+
         if limit:
             tasks = tasks[:limit]
-            
+
         return tasks
-    
+
     def update_task_status(self, task_id, status, **kwargs):
         """Update task status and other fields"""
-        tasks = []
-        updated_task = None
-        
-        if self.queue_file.exists():
-            with open(self.queue_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        task = json.loads(line)
-                        if task['id'] == task_id:
-                            task['status'] = status
-                            task.update(kwargs)
-                            if status == 'completed':
-                                task['completed_at'] = datetime.now().isoformat()
-                            updated_task = task
-                        tasks.append(task)
-        
-        # Rewrite queue file
-        with open(self.queue_file, 'w') as f:
-            for task in tasks:
-                f.write(json.dumps(task) + '\n')
-        
+        self._load_tasks_cached()
+        updated_task = next((t for t in self._tasks_cache if t['id'] == task_id), None)
+
+        if updated_task is None:
+            return None
+
+        old_status = updated_task['status']
+        fields = {'status': status, **kwargs}
+        if status == 'completed':
+            # Epoch twin of the ISO timestamp so status counting never has
+            # to parse date strings
+            now = datetime.now()
+            fields['completed_at'] = now.isoformat()
+            fields['completed_at_epoch'] = int(now.timestamp())
+        updated_task.update(fields)
+
+        # Keep the counters and heap in sync with the transition
+        self._status_counts[old_status] -= 1
+        self._status_counts[status] += 1
+        if status == 'pending' and old_status != 'pending':
+            heapq.heappush(self._pending_heap,
+                           (-updated_task['priority'], updated_task['created_at'], task_id))
+
+        if self._db is not None:
+            self._db_upsert(updated_task)
+        else:
+            self._append_delta({'op': 'update', 'id': task_id, **fields})
+
         # Archive completed tasks
-        if status == 'completed' and updated_task:
+        if status == 'completed':
             with open(self.completed_file, 'a') as f:
-                f.write(json.dumps(updated_task) + '\n')
-        
+                f.write(_dumps_line(updated_task))
+
         return updated_task
-    
+
     def delete_task(self, task_id):
         """Delete a task from the queue"""
-        tasks = []
-        deleted_task = None
-        
-        if self.queue_file.exists():
-            with open(self.queue_file, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        task = json.loads(line)
-                        if task['id'] != task_id:
-                            tasks.append(task)
-                        else:
-                            deleted_task = task
-        
-        # Rewrite queue file
-        with open(self.queue_file, 'w') as f:
-            for task in tasks:
-                f.write(json.dumps(task) + '\n')
-        
+        self._load_tasks_cached()
+        deleted_task = next((t for t in self._tasks_cache if t['id'] == task_id), None)
+
         if deleted_task:
+            self._tasks_cache = [t for t in self._tasks_cache if t['id'] != task_id]
+            del self._by_id[task_id]
+            self._status_counts[deleted_task['status']] -= 1
+            if self._db is not None:
+                with self._db_lock:
+                    self._db.execute('DELETE FROM tasks WHERE id = ?', (task_id,))
+                    self._db.commit()
+            else:
+                self._append_delta({'op': 'delete', 'id': task_id})
             self._log(f"🗑️ Task deleted: {deleted_task['task']}")
-            
+
         return deleted_task is not None
     
     def trigger_claude_execution(self, task):
@@ -201,9 +557,13 @@ class ClaudeTaskManager:
             'trigger_source': 'claude-tasker'
         }
         
-        with open(trigger_file, 'w') as f:
-            json.dump(trigger_data, f, indent=2)
-        
+        # Machine-consumed file - compact serialization, no pretty-printing
+        with open(trigger_file, 'wb') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(trigger_data))
+            else:
+                f.write(json.dumps(trigger_data, separators=(',', ':')).encode('utf-8'))
+
         self._log(f"🚀 Triggered Claude execution: {task['task']}")
         return True
     
@@ -230,47 +590,83 @@ class ClaudeTaskManager:
             self._log(f"❌ Error in autonomous mode: {e}")
     
     async def _async_autonomous_loop(self, interval):
-        """Async loop for autonomous task execution"""
+        """
+        Async loop for autonomous task execution. Event-driven: add_task
+        wakes it immediately, and the interval only serves as a heartbeat
+        fallback - no busy polling while the queue is quiet.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._new_task_event = asyncio.Event()
+        max_workers = self.config.get('max_workers', 2)
+
         while True:
-            task = self.get_next_task()
-            
-            if task:
+            # Drain everything that is ready now, not one task per interval.
+            # Each task is claimed (marked in_progress) before the next heap
+            # peek so the same task isn't picked twice.
+            batch = []
+            while True:
+                task = self.get_next_task()
+                if task is None:
+                    break
+                await self._update_status_async(task['id'], 'in_progress',
+                                                started_at=datetime.now().isoformat())
                 self._log(f"\n⚡ Found task: {task['task']} (Priority: {task['priority']})")
-                
-                # Update status to in-progress
-                self.update_task_status(task['id'], 'in_progress', 
-                                      started_at=datetime.now().isoformat())
-                
-                # Execute with Claude SDK
+                batch.append(task)
+
+            if batch:
+                # execute_many owns the concurrency bound, the API rate
+                # budget and the CLAUDE_USE_BATCH_API routing; results come
+                # back in batch order
                 try:
-                    result = await self.claude_executor.execute_task_autonomously(task)
-                    
-                    if result['success']:
-                        # Mark as completed
-                        self.update_task_status(task['id'], 'completed',
-                                              completed_at=datetime.now().isoformat(),
-                                              execution_result=result,
-                                              actions_executed=result.get('actions_executed', 0))
-                        
-                        self._log(f"✅ Task completed: {task['task']}")
-                        self._log(f"📊 Actions executed: {result.get('actions_executed', 0)}")
-                    else:
-                        # Mark as failed
-                        self.update_task_status(task['id'], 'failed',
-                                              error=result.get('error', 'Unknown error'),
-                                              failed_at=datetime.now().isoformat())
-                        self._log(f"❌ Task failed: {task['task']} - {result.get('error', 'Unknown error')}")
-                        
+                    results = await self.claude_executor.execute_many(
+                        batch, max_concurrency=max_workers)
                 except Exception as e:
-                    self.update_task_status(task['id'], 'failed',
-                                          error=f"SDK execution error: {str(e)}",
-                                          failed_at=datetime.now().isoformat())
                     self._log(f"❌ SDK execution error: {e}")
-            else:
-                # No tasks - show a dot to indicate we're still running
-                print(".", end="", flush=True)
-            
-            await asyncio.sleep(interval)
+                    for task in batch:
+                        await self._update_status_async(
+                            task['id'], 'failed',
+                            error=f"SDK execution error: {str(e)}",
+                            failed_at=datetime.now().isoformat())
+                else:
+                    for task, result in zip(batch, results):
+                        await self._record_task_result(task, result)
+
+            # No tasks - show a dot to indicate we're still running
+            print(".", end="", flush=True)
+
+            try:
+                await asyncio.wait_for(self._new_task_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass  # heartbeat - re-check the queue anyway
+            finally:
+                self._new_task_event.clear()
+
+    async def _update_status_async(self, task_id, status, **kwargs):
+        """Status writes hit the filesystem - keep them off the event loop"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, partial(self.update_task_status, task_id, status, **kwargs))
+
+    async def _record_task_result(self, task, result):
+        """Record one execution outcome from the SDK executor.
+
+        The caller has already claimed the task (marked it in_progress).
+        """
+        if result['success']:
+            # Mark as completed
+            await self._update_status_async(task['id'], 'completed',
+                                  completed_at=datetime.now().isoformat(),
+                                  execution_result=result,
+                                  actions_executed=result.get('actions_executed', 0))
+
+            self._log(f"✅ Task completed: {task['task']}")
+            self._log(f"📊 Actions executed: {result.get('actions_executed', 0)}")
+        else:
+            # Mark as failed
+            await self._update_status_async(task['id'], 'failed',
+                                  error=result.get('error', 'Unknown error'),
+                                  failed_at=datetime.now().isoformat())
+            self._log(f"❌ Task failed: {task['task']} - {result.get('error', 'Unknown error')}")
     
     def _run_legacy_autonomous_mode(self, interval):
         """Legacy autonomous mode without Claude SDK (fallback)"""
@@ -289,9 +685,11 @@ class ClaudeTaskManager:
                     
                     # Trigger Claude execution (legacy file-based method)
                     if self.trigger_claude_execution(task):
-                        # Simulate execution time based on task complexity
-                        execution_time = self._estimate_execution_time(task)
-                        
+                        # Estimate was computed at add time; fall back for
+                        # tasks created before the field was populated
+                        execution_time = task.get('estimated_duration') or self._estimate_execution_time(task)
+
+
                         self._log(f"⏳ Estimated execution time: {execution_time} seconds")
                         time.sleep(min(execution_time, 60))  # Cap at 1 minute for demo
                         
@@ -307,48 +705,69 @@ class ClaudeTaskManager:
                 else:
                     # No tasks - show a dot to indicate we're still running
                     print(".", end="", flush=True)
-                
-                time.sleep(interval)
-                
+
+                # Adaptive wait: track the observed arrival rate instead of
+                # a fixed interval, clamped so bursts never spin and quiet
+                # periods never exceed the configured interval. add_task
+                # sets the event, so new work interrupts the wait instantly.
+                self._wakeup.wait(timeout=max(0.5, min(interval, self._arrival_ewma * 0.5)))
+                self._wakeup.clear()
+
         except KeyboardInterrupt:
+            self._wakeup.set()  # release anything else blocked on it
             self._log("\n🛑 Legacy autonomous mode stopped by user")
         except Exception as e:
             self._log(f"❌ Error in legacy autonomous mode: {e}")
     
     def get_status(self):
         """Get system status"""
-        tasks = self.get_all_tasks()
-        
+        tasks = self._load_tasks_cached()
+
+        # Today's bounds as epoch seconds, computed once - comparing ints
+        # beats fromisoformat-parsing every completed task
+        now = datetime.now()
+        today_start = datetime(now.year, now.month, now.day).timestamp()
+        today_end = today_start + 86400
+
+        completed_today = 0
+        for t in tasks:
+            if t['status'] != 'completed':
+                continue
+            epoch = t.get('completed_at_epoch')
+            if epoch is not None:
+                if today_start <= epoch < today_end:
+                    completed_today += 1
+            elif self._is_today(t.get('completed_at')):
+                # Tasks written before the epoch field existed
+                completed_today += 1
+
         status = {
             'running': True,
-            'queue_size': len([t for t in tasks if t['status'] == 'pending']),
-            'in_progress': len([t for t in tasks if t['status'] == 'in_progress']),
-            'completed_today': len([t for t in tasks if 
-                                  t['status'] == 'completed' and 
-                                  self._is_today(t.get('completed_at'))]),
-            'failed_tasks': len([t for t in tasks if t['status'] == 'failed']),
+            'queue_size': self._status_counts['pending'],
+            'in_progress': self._status_counts['in_progress'],
+            'completed_today': completed_today,
+            'failed_tasks': self._status_counts['failed'],
             'total_tasks': len(tasks),
             'last_activity': datetime.now().isoformat(),
             'config': self.config
         }
-        
+
         return status
     
     def _estimate_execution_time(self, task):
         """Estimate execution time based on task complexity"""
         base_time = 30  # Base 30 seconds
-        
-        # Adjust based on keywords
-        complexity_keywords = {
-            'update': 20, 'install': 30, 'build': 45, 'test': 25, 
-            'deploy': 60, 'fix': 15, 'create': 30, 'refactor': 45
-        }
-        
         task_lower = task['task'].lower()
-        for keyword, time_adj in complexity_keywords.items():
-            if keyword in task_lower:
+
+        # One linear scan of the task text regardless of keyword count
+        if _KEYWORD_AC is not None:
+            for _, (keyword, time_adj) in _KEYWORD_AC.iter(task_lower):
                 base_time = time_adj
                 break
+        else:
+            match = _KEYWORD_RE.search(task_lower)
+            if match:
+                base_time = COMPLEXITY_KEYWORDS[match.group(0)]
         
         # Adjust based on priority (higher priority = more complex)
         priority_multiplier = {5: 1.5, 4: 1.2, 3: 1.0, 2: 0.8, 1: 0.5}
@@ -370,18 +789,33 @@ class ClaudeTaskManager:
         """Log message to console and file"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         log_entry = f"[{timestamp}] {message}"
-        
+
         print(log_entry)
-        
-        # Also log to file
-        with open(self.execution_log, 'a') as f:
-            f.write(log_entry + '\n')
+
+        # Also log to file; only outcome markers force the buffer out so
+        # routine progress lines stay in the 64KB buffer
+        self._log_fp.write(log_entry + '\n')
+        if '✅' in message or '❌' in message:
+            self._log_fp.flush()
+
+    def close(self):
+        """Flush and close the log writer and database (registered with atexit)"""
+        if not self._log_fp.closed:
+            self._log_fp.close()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+                self._db = None
     
     def _generate_token(self):
         """Generate a secure token for webhooks"""
-        import secrets
         return secrets.token_urlsafe(32)
 
+@lru_cache(maxsize=1)
+def get_manager():
+    """Process-wide ClaudeTaskManager singleton"""
+    return ClaudeTaskManager()
+
 def main():
     """Main CLI interface"""
     parser = argparse.ArgumentParser(description='🎯 Claude-Tasker - Autonomous task execution for Claude Code')
@@ -424,7 +858,7 @@ def main():
         parser.print_help()
         return
     
-    manager = ClaudeTaskManager()
+    manager = get_manager()
     
     if args.command == 'add':
         task_id = manager.add_task(args.task, args.priority, args.tags, args.description)
@@ -437,33 +871,38 @@ def main():
             print("No tasks found.")
             return
         
-        print(f"\n📋 Tasks ({len(tasks)}):")
-        print("=" * 60)
-        
+        # Build the listing in memory and flush it with one write - one
+        # syscall instead of several per task
+        out = [f"\n📋 Tasks ({len(tasks)}):", "=" * 60]
+
         status_icons = {'pending': '⏳', 'in_progress': '🔄', 'completed': '✅', 'failed': '❌'}
-        
+
         for task in tasks:
             icon = status_icons.get(task['status'], '❓')
             priority = '●' * task['priority'] + '○' * (5 - task['priority'])
             tags_str = ' '.join(f"#{tag}" for tag in task['tags']) if task['tags'] else ''
-            
-            print(f"{icon} [{priority}] {task['task']}")
+
+            out.append(f"{icon} [{priority}] {task['task']}")
             if tags_str:
-                print(f"    🏷️  {tags_str}")
-            print(f"    📅 {task['created_at'][:19]} | ID: {task['id']}")
-            print()
-    
+                out.append(f"    🏷️  {tags_str}")
+            out.append(f"    📅 {task['created_at'][:19]} | ID: {task['id']}")
+            out.append("")
+
+        sys.stdout.write("\n".join(out) + "\n")
+
     elif args.command == 'status':
         status = manager.get_status()
-        print(f"\n🎯 Claude-Tasker Status")
-        print("=" * 30)
-        print(f"📊 Queue Size: {status['queue_size']}")
-        print(f"🔄 In Progress: {status['in_progress']}")
-        print(f"✅ Completed Today: {status['completed_today']}")
-        print(f"❌ Failed Tasks: {status['failed_tasks']}")
-        print(f"📈 Total Tasks: {status['total_tasks']}")
-        print(f"⏰ Last Activity: {status['last_activity'][:19]}")
-        print(f"⚙️  Check Interval: {status['config']['task_check_interval']}s")
+        sys.stdout.write("\n".join([
+            "\n🎯 Claude-Tasker Status",
+            "=" * 30,
+            f"📊 Queue Size: {status['queue_size']}",
+            f"🔄 In Progress: {status['in_progress']}",
+            f"✅ Completed Today: {status['completed_today']}",
+            f"❌ Failed Tasks: {status['failed_tasks']}",
+            f"📈 Total Tasks: {status['total_tasks']}",
+            f"⏰ Last Activity: {status['last_activity'][:19]}",
+            f"⚙️  Check Interval: {status['config']['task_check_interval']}s",
+        ]) + "\n")
         
     elif args.command == 'run':
         task = manager.get_next_task()
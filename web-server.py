@@ -2,16 +2,44 @@
 """
 Claude-Tasker Web Server
 Simple Flask web interface for task management
+
+Production deployment runs under gunicorn with gevent workers
+(see gunicorn.conf.py); the __main__ block remains as a dev server.
 """
 
+# Patch the stdlib before anything imports sockets so blocking I/O in the
+# API handlers yields cooperatively under the gevent workers; optional so
+# the dev server still runs without gevent installed
+try:
+    from gevent import monkey
+    monkey.patch_all()
+    _ASYNC_MODE = 'gevent'
+except ImportError:
+    # No gevent: fall back to plain threads rather than letting
+    # flask-socketio auto-pick eventlet, which breaks under the gevent
+    # worker and is unmaintained
+    _ASYNC_MODE = 'threading'
+
 import os
+import gzip
+import hashlib
 import json
+import queue
 import sys
+import threading
+import time
+import uuid
 from pathlib import Path
 from datetime import datetime
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
 from flask_cors import CORS
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO, emit, join_room
+
+# Fast JSON for API responses (2-5x stdlib json); optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -27,8 +55,20 @@ except ImportError as e:
 # Flask app setup
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'claude-tasker-secret-key'
-CORS(app)
-socketio = SocketIO(app, cors_allowed_origins="*")
+
+# Route every jsonify through orjson's C encoder when available
+if orjson is not None:
+    from flask.json.provider import JSONProvider
+
+    class OrJSONProvider(JSONProvider):
+        """orjson-backed JSON serialization for Flask responses"""
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrJSONProvider(app)
 
 # Initialize task manager
 task_manager = None
@@ -39,10 +79,269 @@ if TASK_MANAGER_AVAILABLE:
     except Exception as e:
         print(f"❌ Failed to initialize task manager: {e}")
 
+# Naming the origins (instead of *) lets the browser cache one preflight
+# per day rather than one per mutation. The localhost pair covers the
+# default same-origin setup; deployments reached via a LAN IP or hostname
+# list theirs under "allowed_origins" in config.json
+_config = task_manager.config if task_manager and task_manager.config else {}
+web_port = _config.get('web_port', 8080)
+ALLOWED_ORIGINS = _config.get('allowed_origins') or [
+    f"http://localhost:{web_port}", f"http://127.0.0.1:{web_port}"]
+
+CORS(app, origins=ALLOWED_ORIGINS, max_age=86400)
+# Compress engineio payloads above 256 bytes - task JSON is repetitive
+# and deflates well
+socketio = SocketIO(app, cors_allowed_origins=ALLOWED_ORIGINS,
+                    async_mode=_ASYNC_MODE,
+                    http_compression=True, compression_threshold=256)
+
+# Coalescing buffer for mutation broadcasts: bursty add/update/delete
+# traffic flushes as one 'tasks_changed' event per window instead of one
+# emit (and one client refetch) per mutation
+_EVENT_FLUSH_INTERVAL = 0.1  # seconds
+_pending_events = {'added': [], 'updated': [], 'deleted': []}
+_pending_lock = threading.Lock()
+_flusher_started = False
+
+def _ensure_flusher():
+    """Start the broadcast loop once; callers are the mutation path and
+    client connects, so an idle process runs no loop at all"""
+    global _flusher_started
+    with _pending_lock:
+        if not _flusher_started:
+            _flusher_started = True
+            socketio.start_background_task(_flush_events)
+
+def _queue_event(kind, task_id):
+    """Buffer one mutation for the next batched broadcast and drop any
+    cached read-endpoint responses"""
+    _resp_cache.clear()
+    with _pending_lock:
+        _pending_events[kind].append(task_id)
+    _ensure_flusher()
+
+# SSE subscribers: browsers without WebSocket support can consume the
+# same coalesced events from /api/events instead of long-polling
+_sse_subscribers = set()
+_sse_lock = threading.Lock()
+
+def _sse_publish(event, payload):
+    """Fan one event out to all SSE subscriber queues, serialized once"""
+    if not _sse_subscribers:
+        return
+    data = f"event: {event}\ndata: {_json_bytes(payload).decode('utf-8')}\n\n"
+    with _sse_lock:
+        subscribers = list(_sse_subscribers)
+    for q in subscribers:
+        q.put(data)
+
+# Fan-out chunk size: yield to other greenlets between chunks so a large
+# broadcast never blocks API handlers for its full duration
+_BROADCAST_CHUNK = 50
+
+def _broadcast(event, payload):
+    """Emit to the dashboard room, chunking large client counts with a
+    cooperative yield in between"""
+    _sse_publish(event, payload)
+    try:
+        participants = [sid for sid, _ in
+                        socketio.server.manager.get_participants('/', 'dashboard')]
+    except (KeyError, AttributeError):
+        participants = []
+
+    if len(participants) <= _BROADCAST_CHUNK:
+        socketio.emit(event, payload, to='dashboard')
+        return
+
+    for i in range(0, len(participants), _BROADCAST_CHUNK):
+        for sid in participants[i:i + _BROADCAST_CHUNK]:
+            socketio.emit(event, payload, to=sid)
+        socketio.sleep(0)
+
+# The autonomous runner is a separate process, so its status transitions
+# never pass through _queue_event; a coarse poll (cheap through the
+# response/task caches) catches them and turns them into pushes
+_STATUS_POLL_INTERVAL = 2.0  # seconds
+
+def _flush_events():
+    """Background loop: swap the buffer and emit one batch per window,
+    and poll for out-of-process changes on a coarser interval so runner
+    transitions reach the dashboard without client-side polling"""
+    global _pending_events
+    last_status = None
+    last_poll = 0.0
+    while True:
+        socketio.sleep(_EVENT_FLUSH_INTERVAL)
+        with _pending_lock:
+            batch = None
+            if any(_pending_events.values()):
+                batch = _pending_events
+                _pending_events = {'added': [], 'updated': [], 'deleted': []}
+        if batch is not None:
+            _broadcast('tasks_changed', {'batch': batch})
+
+        now = time.monotonic()
+        if batch is None and now - last_poll < _STATUS_POLL_INTERVAL:
+            continue
+        last_poll = now
+
+        # Status is pushed, not polled by clients: one get_status per
+        # window, broadcast only when the numbers actually moved
+        if task_manager:
+            try:
+                status = task_manager.get_status()
+                status['claude_sdk_available'] = task_manager.claude_executor is not None
+                # last_activity is stamped per call - comparing it would
+                # make every poll look like a change
+                comparable = {k: v for k, v in status.items() if k != 'last_activity'}
+                if comparable != last_status:
+                    if batch is None:
+                        # The change came from another process: cached
+                        # reads are stale and the task list moved too
+                        _resp_cache.clear()
+                        _broadcast('tasks_changed', {'batch': None})
+                    _broadcast('status_update', status)
+                    last_status = comparable
+            except Exception as e:
+                print(f"⚠️  Status push failed: {e}")
+
+# Mutations run on a dedicated writer task: request handlers enqueue and
+# answer 202 immediately instead of blocking on task-manager file I/O
+_write_q = queue.Queue()
+_writer_started = False
+
+def _enqueue_write(op, *args):
+    """Hand one mutation to the background writer"""
+    global _writer_started
+    if not _writer_started:
+        _writer_started = True
+        socketio.start_background_task(_writer_loop)
+    _write_q.put((op, args))
+
+def _writer_loop():
+    """Drain queued mutations, apply them, and queue the socket events"""
+    while True:
+        op, args = _write_q.get()
+        try:
+            if op == 'add':
+                task_id, data = args
+                task_manager.add_task(
+                    task=data['task'],
+                    priority=data.get('priority', 3),
+                    tags=data.get('tags', []),
+                    description=data.get('description', ''),
+                    task_id=task_id
+                )
+                _queue_event('added', task_id)
+            elif op == 'delete':
+                (task_id,) = args
+                if task_manager.delete_task(task_id):
+                    _queue_event('deleted', task_id)
+            elif op == 'update':
+                task_id, status = args
+                if task_manager.update_task_status(task_id, status):
+                    _queue_event('updated', task_id)
+        except Exception as e:
+            print(f"⚠️  Background write failed ({op}): {e}")
+
+# Short-lived response cache for the read endpoints: many tabs polling
+# at once share one serialization per TTL window, and any mutation
+# invalidates immediately
+_RESP_CACHE_TTL = 0.5  # seconds
+# Key variety comes from untrusted query strings (?status=, ?limit=), so
+# the cache is capped: expired entries are swept at the cap, and a spray
+# of unique keys just clears the cache instead of growing it
+_RESP_CACHE_MAX = 64
+_resp_cache = {}
+
+def _json_bytes(obj):
+    """Serialize one API payload to bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+# Request bodies are small task descriptions - anything bigger is bogus
+_MAX_BODY_BYTES = 64 * 1024
+
+def _parse_json_body():
+    """Parse the request body straight through orjson, skipping
+    Werkzeug's charset detection; returns None for invalid or oversized
+    payloads"""
+    if (request.content_length or 0) > _MAX_BODY_BYTES:
+        return None
+    raw = request.get_data(cache=False)
+    if not raw or len(raw) > _MAX_BODY_BYTES:
+        return None
+    try:
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+def _cached_body(key):
+    """Return the cached (body, etag) for key, or (None, None)"""
+    entry = _resp_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1], entry[2]
+    return None, None
+
+def _cache_body(key, body):
+    """Cache one serialized body with its ETag for the TTL window, so
+    cache hits are a memcpy plus headers with no hashing"""
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    now = time.monotonic()
+    if len(_resp_cache) >= _RESP_CACHE_MAX:
+        for k in [k for k, v in _resp_cache.items() if v[0] <= now]:
+            _resp_cache.pop(k, None)
+        if len(_resp_cache) >= _RESP_CACHE_MAX:
+            _resp_cache.clear()
+    _resp_cache[key] = (now + _RESP_CACHE_TTL, body, etag)
+    return body, etag
+
+def _conditional_json(body, etag):
+    """JSON response carrying a content ETag; a matching If-None-Match
+    turns it into a bodyless 304"""
+    resp = Response(body, mimetype='application/json')
+    resp.headers['Content-Length'] = str(len(body))
+    # Weak tag: proxies may weaken strong tags anyway, and byte-identity
+    # is all we need for polling clients
+    resp.set_etag(etag, weak=True)
+    resp = resp.make_conditional(request)
+    # Precomputed bytes: hand them straight to the WSGI iterator instead
+    # of letting Werkzeug re-wrap and re-chunk them
+    resp.direct_passthrough = True
+    return resp
+
+@socketio.on('connect')
+def on_connect():
+    """Put every dashboard client in one room so broadcasts hit the room
+    once instead of iterating sessions individually"""
+    join_room('dashboard')
+    _ensure_flusher()
+
 @app.route('/')
 def index():
     """Main dashboard page"""
-    return render_template('index.html')
+    if request.if_none_match.contains(INDEX_ETAG):
+        return '', 304, {'ETag': f'"{INDEX_ETAG}"'}
+
+    headers = {
+        'Vary': 'Accept-Encoding',
+        'ETag': f'"{INDEX_ETAG}"',
+        'Cache-Control': 'public, max-age=60',
+    }
+    # Both variants are precomputed bytes; clients that don't accept gzip
+    # get the plain encoding
+    if 'gzip' in request.accept_encodings:
+        headers['Content-Encoding'] = 'gzip'
+        body = INDEX_GZ
+    else:
+        body = INDEX_BYTES
+    headers['Content-Length'] = str(len(body))
+    resp = Response(body, mimetype='text/html; charset=utf-8', headers=headers)
+    resp.direct_passthrough = True
+    return resp
 
 @app.route('/api/status')
 def api_status():
@@ -50,12 +349,15 @@ def api_status():
     if not task_manager:
         return jsonify({'error': 'Task manager not available'}), 500
     
-    try:
-        status = task_manager.get_status()
-        status['claude_sdk_available'] = task_manager.claude_executor is not None
-        return jsonify(status)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    body, etag = _cached_body('status')
+    if body is None:
+        try:
+            status = task_manager.get_status()
+            status['claude_sdk_available'] = task_manager.claude_executor is not None
+            body, etag = _cache_body('status', _json_bytes(status))
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    return _conditional_json(body, etag)
 
 @app.route('/api/tasks')
 def api_tasks():
@@ -63,13 +365,17 @@ def api_tasks():
     if not task_manager:
         return jsonify({'error': 'Task manager not available'}), 500
     
-    try:
-        status = request.args.get('status')
-        limit = request.args.get('limit', type=int)
-        tasks = task_manager.get_all_tasks(status, limit)
-        return jsonify(tasks)
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    status = request.args.get('status')
+    limit = request.args.get('limit', type=int)
+    body, etag = _cached_body(('tasks', status, limit))
+    if body is None:
+        try:
+            # Largest payload in the API - serialize straight to bytes
+            tasks = task_manager.get_all_tasks(status, limit)
+            body, etag = _cache_body(('tasks', status, limit), _json_bytes(tasks))
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    return _conditional_json(body, etag)
 
 @app.route('/api/tasks', methods=['POST'])
 def api_add_task():
@@ -77,24 +383,15 @@ def api_add_task():
     if not task_manager:
         return jsonify({'error': 'Task manager not available'}), 500
     
-    try:
-        data = request.get_json()
-        if not data or 'task' not in data:
-            return jsonify({'error': 'Task description required'}), 400
-        
-        task_id = task_manager.add_task(
-            task=data['task'],
-            priority=data.get('priority', 3),
-            tags=data.get('tags', []),
-            description=data.get('description', '')
-        )
-        
-        # Emit socket event for real-time updates
-        socketio.emit('task_added', {'task_id': task_id, 'task': data['task']})
-        
-        return jsonify({'task_id': task_id, 'status': 'added'})
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    data = _parse_json_body()
+    if not data or 'task' not in data:
+        return jsonify({'error': 'Task description required'}), 400
+
+    # Generate the id here and let the background writer do the file I/O
+    task_id = f"task_{uuid.uuid4().hex[:16]}"
+    _enqueue_write('add', task_id, data)
+
+    return jsonify({'task_id': task_id, 'status': 'queued'}), 202
 
 @app.route('/api/tasks/<task_id>', methods=['DELETE'])
 def api_delete_task(task_id):
@@ -102,15 +399,8 @@ def api_delete_task(task_id):
     if not task_manager:
         return jsonify({'error': 'Task manager not available'}), 500
     
-    try:
-        success = task_manager.delete_task(task_id)
-        if success:
-            socketio.emit('task_deleted', {'task_id': task_id})
-            return jsonify({'status': 'deleted'})
-        else:
-            return jsonify({'error': 'Task not found'}), 404
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    _enqueue_write('delete', task_id)
+    return jsonify({'task_id': task_id, 'status': 'queued'}), 202
 
 @app.route('/api/tasks/<task_id>/status', methods=['PUT'])
 def api_update_task_status(task_id):
@@ -118,76 +408,135 @@ def api_update_task_status(task_id):
     if not task_manager:
         return jsonify({'error': 'Task manager not available'}), 500
     
-    try:
-        data = request.get_json()
-        if not data or 'status' not in data:
-            return jsonify({'error': 'Status required'}), 400
-        
-        task = task_manager.update_task_status(task_id, data['status'])
-        if task:
-            socketio.emit('task_updated', {'task_id': task_id, 'status': data['status']})
-            return jsonify(task)
-        else:
-            return jsonify({'error': 'Task not found'}), 404
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+    data = _parse_json_body()
+    if not data or 'status' not in data:
+        return jsonify({'error': 'Status required'}), 400
+
+    _enqueue_write('update', task_id, data['status'])
+    return jsonify({'task_id': task_id, 'status': 'queued'}), 202
+
+@app.route('/api/events')
+def api_events():
+    """Server-Sent Events feed mirroring the socket broadcasts"""
+    _ensure_flusher()
+
+    def gen():
+        q = queue.Queue()
+        with _sse_lock:
+            _sse_subscribers.add(q)
+        try:
+            while True:
+                yield q.get()
+        finally:
+            with _sse_lock:
+                _sse_subscribers.discard(q)
+
+    return Response(gen(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
 
 @app.route('/static/<path:filename>')
 def static_files(filename):
-    """Serve static files"""
-    return send_from_directory('static', filename)
-
-# Create templates and static directories with basic files
-def create_web_files():
-    """Create basic web interface files"""
-    templates_dir = Path(__file__).parent / 'templates'
-    static_dir = Path(__file__).parent / 'static'
-    
-    templates_dir.mkdir(exist_ok=True)
-    static_dir.mkdir(exist_ok=True)
-    
-    # Create index.html template
-    index_html = templates_dir / 'index.html'
-    if not index_html.exists():
-        index_html.write_text("""<!DOCTYPE html>
+    """Serve static files with long-lived immutable caching.
+
+    Asset filenames must carry a content hash (e.g. app.abc123.css) so
+    the year-long TTL can never pin a stale version. Hashed in-memory
+    assets are served straight from their precompressed bytes.
+    """
+    asset = _STATIC_ASSETS.get(filename)
+    if asset is not None:
+        body, gz, mimetype = asset
+        headers = {
+            'Cache-Control': 'public, max-age=31536000, immutable',
+            'Vary': 'Accept-Encoding',
+        }
+        if 'gzip' in request.accept_encodings:
+            headers['Content-Encoding'] = 'gzip'
+            body = gz
+        return Response(body, mimetype=mimetype, headers=headers)
+
+    resp = send_from_directory('static', filename, conditional=True,
+                               max_age=31536000)
+    resp.headers['Cache-Control'] += ', immutable'
+    return resp
+
+# Dashboard stylesheet, split out of the HTML so first paint ships a
+# smaller document and the CSS caches immutably under a hashed name
+APP_CSS = """body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }
+.container { max-width: 1200px; margin: 0 auto; }
+.header { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.status-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-bottom: 30px; }
+.status-card { background: white; padding: 20px; border-radius: 8px; text-align: center; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.status-number { font-size: 2em; font-weight: bold; color: #007bff; }
+.add-task { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.form-group { margin-bottom: 15px; }
+.form-group label { display: block; margin-bottom: 5px; font-weight: 500; }
+.form-group input, .form-group textarea, .form-group select { width: 100%; padding: 8px; border: 1px solid #ddd; border-radius: 4px; box-sizing: border-box; }
+.btn { padding: 10px 20px; background: #007bff; color: white; border: none; border-radius: 4px; cursor: pointer; }
+.btn:hover { background: #0056b3; }
+.tasks-container { background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+.task-item { padding: 15px; border-bottom: 1px solid #eee; display: flex; justify-content: space-between; align-items: center; }
+.task-item:last-child { border-bottom: none; }
+.task-info h4 { margin: 0 0 5px 0; color: #333; }
+.task-info p { margin: 0; color: #666; font-size: 0.9em; }
+.task-status { padding: 4px 12px; border-radius: 12px; font-size: 0.8em; font-weight: 500; }
+.status-pending { background: #fff3cd; color: #856404; }
+.status-in_progress { background: #d1ecf1; color: #0c5460; }
+.status-completed { background: #d4edda; color: #155724; }
+.status-failed { background: #f8d7da; color: #721c24; }
+.priority { display: inline-block; margin-left: 10px; }
+.priority-dot { display: inline-block; width: 8px; height: 8px; border-radius: 50%; margin-right: 2px; }
+.priority-1 .priority-dot { background: #28a745; }
+.priority-2 .priority-dot { background: #6f42c1; }
+.priority-3 .priority-dot { background: #17a2b8; }
+.priority-4 .priority-dot { background: #fd7e14; }
+.priority-5 .priority-dot { background: #dc3545; }
+.error { color: #dc3545; background: #f8d7da; padding: 10px; border-radius: 4px; margin: 10px 0; }
+.success { color: #155724; background: #d4edda; padding: 10px; border-radius: 4px; margin: 10px 0; }
+"""
+
+APP_CSS_BYTES = APP_CSS.encode('utf-8')
+APP_CSS_NAME = f"app.{hashlib.blake2b(APP_CSS_BYTES, digest_size=8).hexdigest()}.css"
+
+# In-memory hashed assets with precompressed variants, served by the
+# /static route ahead of the on-disk fallback
+_STATIC_ASSETS = {
+    APP_CSS_NAME: (APP_CSS_BYTES, gzip.compress(APP_CSS_BYTES, 9),
+                   'text/css; charset=utf-8'),
+}
+
+# Socket.IO browser client, vendored so the dashboard loads it same-origin
+# (flask-socketio serves the protocol, not the JS client - hitting
+# /socket.io/socket.io.js returns a protocol error). install.sh and
+# start.sh download the pinned copy into static/; until it exists the
+# script tag falls back to the CDN so a bare checkout still works.
+SOCKET_IO_VERSION = '4.7.5'
+_socket_io_file = Path(__file__).parent / 'static' / 'socket.io.min.js'
+if _socket_io_file.exists():
+    _socket_io_bytes = _socket_io_file.read_bytes()
+    SOCKET_IO_JS_NAME = (f"socket.io."
+                         f"{hashlib.blake2b(_socket_io_bytes, digest_size=8).hexdigest()}"
+                         f".min.js")
+    _STATIC_ASSETS[SOCKET_IO_JS_NAME] = (
+        _socket_io_bytes, gzip.compress(_socket_io_bytes, 9),
+        'application/javascript; charset=utf-8')
+    SOCKET_IO_SRC = f'/static/{SOCKET_IO_JS_NAME}'
+else:
+    print("⚠️  static/socket.io.min.js not found - dashboard will load the "
+          "Socket.IO client from the CDN")
+    SOCKET_IO_SRC = f'https://cdn.socket.io/{SOCKET_IO_VERSION}/socket.io.min.js'
+
+# Dashboard page, embedded and precompressed once at import time - no
+# template lookup or disk read per request, ~70% smaller on the wire,
+# and repeat visits short-circuit to 304 via the ETag
+INDEX_HTML = """<!DOCTYPE html>
 <html>
 <head>
     <title>Claude-Tasker Dashboard</title>
     <meta charset="utf-8">
     <meta name="viewport" content="width=device-width, initial-scale=1">
-    <style>
-        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }
-        .container { max-width: 1200px; margin: 0 auto; }
-        .header { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        .status-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-bottom: 30px; }
-        .status-card { background: white; padding: 20px; border-radius: 8px; text-align: center; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        .status-number { font-size: 2em; font-weight: bold; color: #007bff; }
-        .add-task { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        .form-group { margin-bottom: 15px; }
-        .form-group label { display: block; margin-bottom: 5px; font-weight: 500; }
-        .form-group input, .form-group textarea, .form-group select { width: 100%; padding: 8px; border: 1px solid #ddd; border-radius: 4px; box-sizing: border-box; }
-        .btn { padding: 10px 20px; background: #007bff; color: white; border: none; border-radius: 4px; cursor: pointer; }
-        .btn:hover { background: #0056b3; }
-        .tasks-container { background: white; border-radius: 8px; overflow: hidden; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        .task-item { padding: 15px; border-bottom: 1px solid #eee; display: flex; justify-content: space-between; align-items: center; }
-        .task-item:last-child { border-bottom: none; }
-        .task-info h4 { margin: 0 0 5px 0; color: #333; }
-        .task-info p { margin: 0; color: #666; font-size: 0.9em; }
-        .task-status { padding: 4px 12px; border-radius: 12px; font-size: 0.8em; font-weight: 500; }
-        .status-pending { background: #fff3cd; color: #856404; }
-        .status-in_progress { background: #d1ecf1; color: #0c5460; }
-        .status-completed { background: #d4edda; color: #155724; }
-        .status-failed { background: #f8d7da; color: #721c24; }
-        .priority { display: inline-block; margin-left: 10px; }
-        .priority-dot { display: inline-block; width: 8px; height: 8px; border-radius: 50%; margin-right: 2px; }
-        .priority-1 .priority-dot { background: #28a745; }
-        .priority-2 .priority-dot { background: #6f42c1; }
-        .priority-3 .priority-dot { background: #17a2b8; }
-        .priority-4 .priority-dot { background: #fd7e14; }
-        .priority-5 .priority-dot { background: #dc3545; }
-        .error { color: #dc3545; background: #f8d7da; padding: 10px; border-radius: 4px; margin: 10px 0; }
-        .success { color: #155724; background: #d4edda; padding: 10px; border-radius: 4px; margin: 10px 0; }
-    </style>
+    <link rel="stylesheet" href="__APP_CSS__">
 </head>
 <body>
     <div class="container">
@@ -253,18 +602,15 @@ def create_web_files():
         </div>
     </div>
 
-    <script src="/socket.io/socket.io.js"></script>
+    <script src="__SOCKET_IO__"></script>
     <script>
         const socket = io();
         
-        // Load initial data
+        // Load initial data once; afterwards the server pushes changes,
+        // so idle tabs generate no polling traffic
         loadStatus();
         loadTasks();
         
-        // Refresh data every 5 seconds
-        setInterval(loadStatus, 5000);
-        setInterval(loadTasks, 10000);
-        
         // Handle form submission
         document.getElementById('add-task-form').addEventListener('submit', async (e) => {
             e.preventDefault();
@@ -298,28 +644,27 @@ def create_web_files():
             }
         });
         
-        // Socket event handlers
-        socket.on('task_added', (data) => {
+        // One batched event per flush window covers adds, updates and
+        // deletes - a single refetch regardless of burst size
+        socket.on('tasks_changed', (data) => {
             loadTasks();
-            loadStatus();
         });
         
-        socket.on('task_updated', (data) => {
-            loadTasks();
-            loadStatus();
-        });
-        
-        socket.on('task_deleted', (data) => {
-            loadTasks();
-            loadStatus();
+        socket.on('status_update', (data) => {
+            updateStatusCards(data);
         });
         
         async function loadStatus() {
             try {
                 const response = await fetch('/api/status');
-                const data = await response.json();
-                
-                document.getElementById('queue-size').textContent = data.queue_size || 0;
+                updateStatusCards(await response.json());
+            } catch (err) {
+                console.error('Failed to load status:', err);
+            }
+        }
+        
+        function updateStatusCards(data) {
+            document.getElementById('queue-size').textContent = data.queue_size || 0;
                 document.getElementById('in-progress').textContent = data.in_progress || 0;
                 document.getElementById('completed-today').textContent = data.completed_today || 0;
                 document.getElementById('failed-tasks').textContent = data.failed_tasks || 0;
@@ -328,48 +673,83 @@ def create_web_files():
                 const sdkStatus = document.getElementById('sdk-status');
                 if (data.claude_sdk_available) {
                     sdkStatus.innerHTML = '<div class="success">✅ Claude SDK Connected - Autonomous execution enabled</div>';
-                } else {
-                    sdkStatus.innerHTML = '<div class="error">❌ Claude SDK not available - Add API key to ~/.claude-tasker/.env</div>';
-                }
-            } catch (err) {
-                console.error('Failed to load status:', err);
+            } else {
+                sdkStatus.innerHTML = '<div class="error">❌ Claude SDK not available - Add API key to ~/.claude-tasker/.env</div>';
             }
         }
         
+        // Row nodes cached by task id: refreshes only touch the rows
+        // that actually changed instead of rebuilding the whole list
+        const taskRows = new Map();
+        
         async function loadTasks() {
             try {
                 const response = await fetch('/api/tasks?limit=20');
-                const tasks = await response.json();
-                
-                const tasksList = document.getElementById('tasks-list');
-                
-                if (tasks.length === 0) {
-                    tasksList.innerHTML = '<div style="padding: 40px; text-align: center; color: #666;">No tasks found. Add one above!</div>';
-                    return;
-                }
-                
-                tasksList.innerHTML = tasks.map(task => `
-                    <div class="task-item">
-                        <div class="task-info">
-                            <h4>${escapeHtml(task.task)}
-                                <span class="priority priority-${task.priority}">
-                                    ${Array(task.priority).fill('<span class="priority-dot"></span>').join('')}
-                                </span>
-                            </h4>
-                            <p>Created: ${new Date(task.created_at).toLocaleString()}</p>
-                            ${task.description ? `<p>${escapeHtml(task.description)}</p>` : ''}
-                        </div>
-                        <div>
-                            <span class="task-status status-${task.status}">${task.status.replace('_', ' ')}</span>
-                        </div>
-                    </div>
-                `).join('');
+                renderTasks(await response.json());
             } catch (err) {
                 console.error('Failed to load tasks:', err);
-                document.getElementById('tasks-list').innerHTML = '<div style="padding: 40px; text-align: center; color: #dc3545;">Error loading tasks</div>';
             }
         }
         
+        function taskRowHtml(task) {
+            return `
+                <div class="task-info">
+                    <h4>${escapeHtml(task.task)}
+                        <span class="priority priority-${task.priority}">
+                            ${Array(task.priority).fill('<span class="priority-dot"></span>').join('')}
+                        </span>
+                    </h4>
+                    <p>Created: ${new Date(task.created_at).toLocaleString()}</p>
+                    ${task.description ? `<p>${escapeHtml(task.description)}</p>` : ''}
+                </div>
+                <div>
+                    <span class="task-status status-${task.status}">${task.status.replace('_', ' ')}</span>
+                </div>`;
+        }
+        
+        function renderTasks(tasks) {
+            const tasksList = document.getElementById('tasks-list');
+            
+            if (tasks.length === 0) {
+                taskRows.clear();
+                tasksList.innerHTML = '<div style="padding: 40px; text-align: center; color: #666;">No tasks found. Add one above!</div>';
+                return;
+            }
+            
+            if (taskRows.size === 0) {
+                tasksList.innerHTML = '';
+            }
+            
+            const seen = new Set();
+            const frag = document.createDocumentFragment();
+            
+            for (const task of tasks) {
+                seen.add(task.id);
+                const sig = [task.status, task.priority, task.task, task.description].join('\u0000');
+                let entry = taskRows.get(task.id);
+                if (!entry) {
+                    const node = document.createElement('div');
+                    node.className = 'task-item';
+                    node.innerHTML = taskRowHtml(task);
+                    entry = { node, sig };
+                    taskRows.set(task.id, entry);
+                } else if (entry.sig !== sig) {
+                    entry.node.innerHTML = taskRowHtml(task);
+                    entry.sig = sig;
+                }
+                frag.appendChild(entry.node);
+            }
+            
+            for (const [id, entry] of taskRows) {
+                if (!seen.has(id)) {
+                    entry.node.remove();
+                    taskRows.delete(id);
+                }
+            }
+            
+            tasksList.appendChild(frag);
+        }
+        
         function showMessage(message, type) {
             const messageDiv = document.createElement('div');
             messageDiv.className = type;
@@ -381,24 +761,26 @@ def create_web_files():
             setTimeout(() => messageDiv.remove(), 5000);
         }
         
+        // Table-lookup escaping: no DOM allocation per call
+        const ESC = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
         function escapeHtml(text) {
-            const div = document.createElement('div');
-            div.textContent = text;
-            return div.innerHTML;
+            return String(text).replace(/[&<>"']/g, c => ESC[c]);
         }
     </script>
 </body>
-</html>""")
+</html>"""
+
+INDEX_HTML = INDEX_HTML.replace('__APP_CSS__', f'/static/{APP_CSS_NAME}')
+INDEX_HTML = INDEX_HTML.replace('__SOCKET_IO__', SOCKET_IO_SRC)
+INDEX_BYTES = INDEX_HTML.encode('utf-8')
+INDEX_GZ = gzip.compress(INDEX_BYTES, 9)
+# Unquoted digest: Werkzeug's if_none_match container holds parsed tags
+# without their quotes, so storing the quoted form would never match
+INDEX_ETAG = hashlib.blake2b(INDEX_BYTES, digest_size=16).hexdigest()
 
 if __name__ == '__main__':
-    # Create web files if they don't exist
-    create_web_files()
-    
-    # Get port from config or use default
-    port = 8080
-    if task_manager and task_manager.config:
-        port = task_manager.config.get('web_port', 8080)
-    
+    port = web_port
+
     print(f"🌐 Starting Claude-Tasker web server on port {port}")
     print(f"📊 Dashboard: http://localhost:{port}")
     